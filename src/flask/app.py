@@ -4,10 +4,8 @@ import collections.abc as cabc
 import os
 import sys
 import typing as t
-import weakref
 from datetime import timedelta
 from inspect import iscoroutinefunction
-from itertools import chain
 from types import TracebackType
 from urllib.parse import quote as _url_quote
 
@@ -41,6 +39,7 @@ from .helpers import get_debug_flag
 from .helpers import get_flashed_messages
 from .helpers import get_load_dotenv
 from .helpers import send_from_directory
+from .sansio.app import _RequestPipeline
 from .sansio.app import App
 from .sansio.scaffold import _sentinel
 from .sessions import SecureCookieSessionInterface
@@ -78,6 +77,12 @@ def _make_timedelta(value: timedelta | int | None) -> timedelta | None:
     return timedelta(seconds=value)
 
 
+def _send_static_file(filename: str) -> Response:
+    # The view for the static route. Using current_app instead of a
+    # closure over the app avoids a reference cycle (see #3761).
+    return current_app.send_static_file(filename)
+
+
 class Flask(App):
     """The flask object implements a WSGI application and acts as the central
     object.  It is passed the name of the module or package of the
@@ -268,14 +273,11 @@ class Flask(App):
             assert (
                 bool(static_host) == host_matching
             ), "Invalid static_host/host_matching combination"
-            # Use a weakref to avoid creating a reference cycle between the app
-            # and the view function (see #3761).
-            self_ref = weakref.ref(self)
             self.add_url_rule(
                 f"{self.static_url_path}/<path:filename>",
                 endpoint="static",
                 host=static_host,
-                view_func=lambda **kw: self_ref().send_static_file(**kw),  # type: ignore # noqa: B950
+                view_func=_send_static_file,
             )
 
     def get_send_file_max_age(self, filename: str | None) -> int | None:
@@ -466,9 +468,9 @@ class Flask(App):
             )
 
         # Need at least SERVER_NAME to match/build outside a request.
-        if self.config["SERVER_NAME"] is not None:
+        if (server_name := self.config["SERVER_NAME"]) is not None:
             return self.url_map.bind(
-                self.config["SERVER_NAME"],
+                server_name,
                 script_name=self.config["APPLICATION_ROOT"],
                 url_scheme=self.config["PREFERRED_URL_SCHEME"],
             )
@@ -514,20 +516,18 @@ class Flask(App):
         :param context: the context as a dictionary that is updated in place
                         to add extra variables.
         """
-        names: t.Iterable[str | None] = (None,)
-
         # A template may be rendered outside a request context.
         if request:
-            names = chain(names, reversed(request.blueprints))
+            pipeline = self._get_pipeline(request.blueprint)
+        else:
+            pipeline = self._get_pipeline(None)
 
         # The values passed to render_template take precedence. Keep a
         # copy to re-apply after all context functions.
         orig_ctx = context.copy()
 
-        for name in names:
-            if name in self.template_context_processors:
-                for func in self.template_context_processors[name]:
-                    context.update(self.ensure_sync(func)())
+        for func in pipeline.template_context_processors:
+            context.update(func())
 
         context.update(orig_ctx)
 
@@ -624,8 +624,8 @@ class Flask(App):
             cli.load_dotenv()
 
             # if set, env var overrides existing value
-            if "FLASK_DEBUG" in os.environ:
-                self.debug = get_debug_flag()
+            if debug is None and "FLASK_DEBUG" in os.environ:
+                debug = get_debug_flag()
 
         # debug passed to method overrides all other sources
         if debug is not None:
@@ -911,7 +911,11 @@ class Flask(App):
         self._got_first_request = True
 
         try:
-            request_started.send(self, _async_wrapper=self.ensure_sync)
+            # Sending a signal with no receivers does nothing, skip the
+            # call. The same is done for the other per request signals.
+            if request_started.receivers:
+                request_started.send(self, _async_wrapper=self.ensure_sync)
+
             rv = self.preprocess_request()
             if rv is None:
                 rv = self.dispatch_request()
@@ -939,9 +943,11 @@ class Flask(App):
         response = self.make_response(rv)
         try:
             response = self.process_response(response)
-            request_finished.send(
-                self, _async_wrapper=self.ensure_sync, response=response
-            )
+
+            if request_finished.receivers:
+                request_finished.send(
+                    self, _async_wrapper=self.ensure_sync, response=response
+                )
         except Exception:
             if not from_error_handler:
                 raise
@@ -958,7 +964,22 @@ class Flask(App):
         .. versionadded:: 0.7
         """
         adapter = request_ctx.url_adapter
-        methods = adapter.allowed_methods()  # type: ignore[union-attr]
+        rule = request_ctx.request.url_rule
+        methods: t.Iterable[str] | None
+
+        # Without variable parts, the rule only matches one URL, so the
+        # methods allowed for it don't change between requests.
+        if rule is not None and not rule.arguments:
+            key = (rule.subdomain, rule.host, rule.rule)
+            methods = self._options_methods.get(key)
+
+            if methods is None:
+                methods = self._options_methods[key] = frozenset(
+                    adapter.allowed_methods()  # type: ignore[union-attr]
+                )
+        else:
+            methods = adapter.allowed_methods()  # type: ignore[union-attr]
+
         rv = self.response_class()
         rv.allow.update(methods)
         return rv
@@ -977,6 +998,25 @@ class Flask(App):
 
         return func
 
+    def _make_pipeline(self, blueprints: tuple[str, ...]) -> _RequestPipeline:
+        pipeline = super()._make_pipeline(blueprints)
+        # Wrap the hooks with ensure_sync once when the pipeline is built,
+        # rather than every time they are called.
+        return pipeline._replace(
+            before_request_funcs=tuple(
+                map(self.ensure_sync, pipeline.before_request_funcs)
+            ),
+            after_request_funcs=tuple(
+                map(self.ensure_sync, pipeline.after_request_funcs)
+            ),
+            teardown_request_funcs=tuple(
+                map(self.ensure_sync, pipeline.teardown_request_funcs)
+            ),
+            template_context_processors=tuple(
+                map(self.ensure_sync, pipeline.template_context_processors)
+            ),
+        )
+
     def async_to_sync(
         self, func: t.Callable[..., t.Coroutine[t.Any, t.Any, t.Any]]
     ) -> t.Callable[..., t.Any]:
@@ -1182,6 +1222,13 @@ class Flask(App):
            Previously a tuple was interpreted as the arguments for the
            response object.
         """
+        # Views commonly return a response object, which needs no
+        # conversion, or a plain string body with no status or headers.
+        if type(rv) is self.response_class:
+            return rv
+
+        if type(rv) is str:
+            return self.response_class(rv)
 
         status: int | None = None
         headers: HeadersValue | None = None
@@ -1278,20 +1325,17 @@ class Flask(App):
         value is handled as if it was the return value from the view, and
         further request handling is stopped.
         """
-        names = (None, *reversed(request.blueprints))
+        req = request_ctx.request
+        pipeline = self._get_pipeline(req.blueprint)
 
-        for name in names:
-            if name in self.url_value_preprocessors:
-                for url_func in self.url_value_preprocessors[name]:
-                    url_func(request.endpoint, request.view_args)
+        for url_func in pipeline.url_value_preprocessors:
+            url_func(req.endpoint, req.view_args)
 
-        for name in names:
-            if name in self.before_request_funcs:
-                for before_func in self.before_request_funcs[name]:
-                    rv = self.ensure_sync(before_func)()
+        for before_func in pipeline.before_request_funcs:
+            rv = before_func()
 
-                    if rv is not None:
-                        return rv  # type: ignore[no-any-return]
+            if rv is not None:
+                return rv  # type: ignore[no-any-return]
 
         return None
 
@@ -1313,10 +1357,10 @@ class Flask(App):
         for func in ctx._after_request_functions:
             response = self.ensure_sync(func)(response)
 
-        for name in chain(request.blueprints, (None,)):
-            if name in self.after_request_funcs:
-                for func in reversed(self.after_request_funcs[name]):
-                    response = self.ensure_sync(func)(response)
+        pipeline = self._get_pipeline(ctx.request.blueprint)
+
+        for func in pipeline.after_request_funcs:
+            response = func(response)
 
         if not self.session_interface.is_null_session(ctx.session):
             self.session_interface.save_session(self, ctx.session, response)
@@ -1350,12 +1394,13 @@ class Flask(App):
         if exc is _sentinel:
             exc = sys.exc_info()[1]
 
-        for name in chain(request.blueprints, (None,)):
-            if name in self.teardown_request_funcs:
-                for func in reversed(self.teardown_request_funcs[name]):
-                    self.ensure_sync(func)(exc)
+        pipeline = self._get_pipeline(request.blueprint)
+
+        for func in pipeline.teardown_request_funcs:
+            func(exc)
 
-        request_tearing_down.send(self, _async_wrapper=self.ensure_sync, exc=exc)
+        if request_tearing_down.receivers:
+            request_tearing_down.send(self, _async_wrapper=self.ensure_sync, exc=exc)
 
     def do_teardown_appcontext(
         self,
@@ -1381,7 +1426,8 @@ class Flask(App):
         for func in reversed(self.teardown_appcontext_funcs):
             self.ensure_sync(func)(exc)
 
-        appcontext_tearing_down.send(self, _async_wrapper=self.ensure_sync, exc=exc)
+        if appcontext_tearing_down.receivers:
+            appcontext_tearing_down.send(self, _async_wrapper=self.ensure_sync, exc=exc)
 
     def app_context(self) -> AppContext:
         """Create an :class:`~flask.ctx.AppContext`. Use as a ``with``
@@ -151,10 +151,8 @@ class Config(dict):  # type: ignore[type-arg]
         """
         prefix = f"{prefix}_"
 
-        for key in sorted(os.environ):
-            if not key.startswith(prefix):
-                continue
-
+        # Only sort the matching keys, most variables won't have the prefix.
+        for key in sorted(k for k in os.environ if k.startswith(prefix)):
             value = os.environ[key]
             key = key.removeprefix(prefix)
 
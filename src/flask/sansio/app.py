@@ -5,6 +5,7 @@ import os
 import sys
 import typing as t
 from datetime import timedelta
+from functools import cached_property
 from itertools import chain
 
 from werkzeug.exceptions import Aborter
@@ -14,7 +15,6 @@ from werkzeug.routing import BuildError
 from werkzeug.routing import Map
 from werkzeug.routing import Rule
 from werkzeug.sansio.response import Response
-from werkzeug.utils import cached_property
 from werkzeug.utils import redirect as _wz_redirect
 
 from .. import typing as ft
@@ -29,6 +29,7 @@ from ..logging import create_logger
 from ..templating import DispatchingJinjaLoader
 from ..templating import Environment
 from .scaffold import _endpoint_from_view_func
+from .scaffold import _sentinel
 from .scaffold import find_package
 from .scaffold import Scaffold
 from .scaffold import setupmethod
@@ -48,6 +49,9 @@ T_template_filter = t.TypeVar("T_template_filter", bound=ft.TemplateFilterCallab
 T_template_global = t.TypeVar("T_template_global", bound=ft.TemplateGlobalCallable)
 T_template_test = t.TypeVar("T_template_test", bound=ft.TemplateTestCallable)
 
+# The most entries App._error_handler_cache holds before it is cleared.
+_ERROR_HANDLER_CACHE_SIZE = 256
+
 
 def _make_timedelta(value: timedelta | int | None) -> timedelta | None:
     if value is None or isinstance(value, timedelta):
@@ -56,6 +60,18 @@ def _make_timedelta(value: timedelta | int | None) -> timedelta | None:
     return timedelta(seconds=value)
 
 
+class _RequestPipeline(t.NamedTuple):
+    """The request hooks that apply to a request handled by a given
+    chain of blueprints, flattened in the order they are called.
+    """
+
+    url_value_preprocessors: tuple[ft.URLValuePreprocessorCallable, ...]
+    before_request_funcs: tuple[t.Callable[..., t.Any], ...]
+    after_request_funcs: tuple[t.Callable[..., t.Any], ...]
+    teardown_request_funcs: tuple[t.Callable[..., t.Any], ...]
+    template_context_processors: tuple[t.Callable[..., t.Any], ...]
+
+
 class App(Scaffold):
     """The flask object implements a WSGI application and acts as the central
     object.  It is passed the name of the module or package of the
@@ -410,6 +426,29 @@ class App(Scaffold):
         # request.
         self._got_first_request = False
 
+        # The methods allowed for URL rules without variable parts, used to
+        # answer automatic OPTIONS requests without matching the URL map
+        # again. Keyed by the rule's subdomain, host, and rule string.
+        self._options_methods: dict[
+            tuple[str | None, str | None, str], frozenset[str]
+        ] = {}
+
+        # The result of _find_error_handler for an exception class and
+        # the blueprints handling the request. Cleared when it grows past
+        # _ERROR_HANDLER_CACHE_SIZE, so exception classes created at
+        # runtime don't accumulate.
+        self._error_handler_cache: dict[
+            tuple[type[Exception], tuple[str, ...]], ft.ErrorHandlerCallable | None
+        ] = {}
+
+        # The request hooks for each blueprint that handled a request,
+        # see _get_pipeline.
+        self._pipeline_cache: dict[str | None, _RequestPipeline] = {}
+
+        # The URL default functions that apply to the endpoints in each
+        # registered blueprint, see inject_url_defaults.
+        self._url_defaults_cache: dict[str, tuple[ft.URLDefaultCallable, ...]] = {}
+
     def _check_setup_finished(self, f_name: str) -> None:
         if self._got_first_request:
             raise AssertionError(
@@ -422,6 +461,73 @@ class App(Scaffold):
                 " running it."
             )
 
+        # A setup method may change the data the cached lookups were built
+        # from, discard them so they are built again when needed.
+        self._clear_setup_caches()
+
+    def _clear_setup_caches(self) -> None:
+        self._options_methods.clear()
+        self._error_handler_cache.clear()
+        self._pipeline_cache.clear()
+        self._url_defaults_cache.clear()
+
+    def _get_pipeline(self, blueprint: str | None) -> _RequestPipeline:
+        """Get the request hooks for a request handled by the given
+        blueprint, as returned by :attr:`.Request.blueprint`. The
+        pipeline is built by :meth:`_make_pipeline` the first time, so
+        the blueprint name is only split into its parents once.
+        """
+        pipeline = self._pipeline_cache.get(blueprint)
+
+        if pipeline is None:
+            if blueprint is None:
+                blueprints: tuple[str, ...] = ()
+            else:
+                blueprints = tuple(_split_blueprint_path(blueprint))
+
+            pipeline = self._pipeline_cache[blueprint] = self._make_pipeline(blueprints)
+
+        return pipeline
+
+    def _make_pipeline(self, blueprints: tuple[str, ...]) -> _RequestPipeline:
+        """Collect the request hooks for a request handled by the given
+        blueprints.
+
+        The hooks registered for the app are called first before the
+        request, then those of each blueprint from the outermost parent.
+        After the request the order is reversed, and the functions
+        registered for each scope are called in reverse order.
+        """
+        names = (None, *reversed(blueprints))
+        reverse_names = (*blueprints, None)
+        return _RequestPipeline(
+            tuple(
+                func
+                for name in names
+                for func in self.url_value_preprocessors.get(name, ())
+            ),
+            tuple(
+                func
+                for name in names
+                for func in self.before_request_funcs.get(name, ())
+            ),
+            tuple(
+                func
+                for name in reverse_names
+                for func in reversed(self.after_request_funcs.get(name, ()))
+            ),
+            tuple(
+                func
+                for name in reverse_names
+                for func in reversed(self.teardown_request_funcs.get(name, ()))
+            ),
+            tuple(
+                func
+                for name in names
+                for func in self.template_context_processors.get(name, ())
+            ),
+        )
+
     @cached_property
     def name(self) -> str:  # type: ignore
         """The name of the application.  This is usually the import name
@@ -491,9 +597,10 @@ class App(Scaffold):
         root_path = self.root_path
         if instance_relative:
             root_path = self.instance_path
-        defaults = dict(self.default_config)
-        defaults["DEBUG"] = get_debug_flag()
-        return self.config_class(root_path, defaults)
+        # The config copies the defaults, set the debug flag on that copy.
+        config = self.config_class(root_path, self.default_config)
+        config["DEBUG"] = get_debug_flag()
+        return config
 
     def make_aborter(self) -> Aborter:
         """Create the object to assign to :attr:`aborter`. That object
@@ -828,12 +935,30 @@ class App(Scaffold):
         blueprint handler for an exception class, app handler for an exception
         class, or ``None`` if a suitable handler is not found.
         """
-        exc_class, code = self._get_exc_class_and_code(type(e))
+        key = (type(e), tuple(blueprints))
+        handler = self._error_handler_cache.get(key, _sentinel)
+
+        if handler is _sentinel:
+            handler = self._lookup_error_handler(*key)
+
+            if len(self._error_handler_cache) >= _ERROR_HANDLER_CACHE_SIZE:
+                self._error_handler_cache.clear()
+
+            self._error_handler_cache[key] = handler
+
+        return handler  # type: ignore[return-value]
+
+    def _lookup_error_handler(
+        self, exc_type: type[Exception], blueprints: tuple[str, ...]
+    ) -> ft.ErrorHandlerCallable | None:
+        exc_class, code = self._get_exc_class_and_code(exc_type)
         names = (*blueprints, None)
 
         for c in (code, None) if code is not None else (None,):
             for name in names:
-                handler_map = self.error_handler_spec[name][c]
+                # Don't index the defaultdicts, that would add an empty
+                # entry for every scope and code that was looked up.
+                handler_map = self.error_handler_spec.get(name, {}).get(c)
 
                 if not handler_map:
                     continue
@@ -915,19 +1040,30 @@ class App(Scaffold):
 
         .. versionadded:: 0.7
         """
-        names: t.Iterable[str | None] = (None,)
-
         # url_for may be called outside a request context, parse the
         # passed endpoint instead of using request.blueprints.
-        if "." in endpoint:
-            names = chain(
-                names, reversed(_split_blueprint_path(endpoint.rpartition(".")[0]))
+        blueprint = endpoint.rpartition(".")[0]
+        funcs = self._url_defaults_cache.get(blueprint)
+
+        if funcs is None:
+            names: t.Iterable[str | None] = (None,)
+
+            if blueprint:
+                names = chain(names, reversed(_split_blueprint_path(blueprint)))
+
+            funcs = tuple(
+                func
+                for name in names
+                for func in self.url_default_functions.get(name, ())
             )
 
-        for name in names:
-            if name in self.url_default_functions:
-                for func in self.url_default_functions[name]:
-                    func(endpoint, values)
+            # The endpoint may come from user input, only cache registered
+            # blueprints so unknown names don't grow the cache.
+            if not blueprint or blueprint in self.blueprints:
+                self._url_defaults_cache[blueprint] = funcs
+
+        for func in funcs:
+            func(endpoint, values)
 
     def handle_url_build_error(
         self, error: BuildError, endpoint: str, values: dict[str, t.Any]
@@ -389,15 +389,11 @@ class Blueprint(Scaffold):
             key = name if key is None else f"{name}.{key}"
             value = defaultdict(
                 dict,
-                {
-                    code: {exc_class: func for exc_class, func in code_values.items()}
-                    for code, code_values in value.items()
-                },
+                {code: dict(code_values) for code, code_values in value.items()},
             )
             app.error_handler_spec[key] = value
 
-        for endpoint, func in self.view_functions.items():
-            app.view_functions[endpoint] = func
+        app.view_functions.update(self.view_functions)
 
         extend(self.before_request_funcs, app.before_request_funcs)
         extend(self.after_request_funcs, app.after_request_funcs)
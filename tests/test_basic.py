@@ -50,6 +50,24 @@ def test_options_on_multiple_rules(app, client):
     assert sorted(rv.allow) == ["GET", "HEAD", "OPTIONS", "POST", "PUT"]
 
 
+def test_options_rule_added_later(app):
+    @app.route("/")
+    def index():
+        return "Hello World"
+
+    with app.test_request_context("/", method="OPTIONS"):
+        rv = app.make_default_options_response()
+        assert sorted(rv.allow) == ["GET", "HEAD", "OPTIONS"]
+
+    @app.post("/")
+    def index_post():
+        return "Aha!"
+
+    with app.test_request_context("/", method="OPTIONS"):
+        rv = app.make_default_options_response()
+        assert sorted(rv.allow) == ["GET", "HEAD", "OPTIONS", "POST"]
+
+
 @pytest.mark.parametrize("method", ["get", "post", "put", "delete", "patch"])
 def test_method_route(app, client, method):
     method_route = getattr(app, method)
@@ -857,6 +875,95 @@ def test_before_after_request_order(app, client):
     assert called == [1, 2, 3, 4, 5, 6]
 
 
+def test_request_hooks_registered_after_use(app):
+    parent = flask.Blueprint("parent", __name__)
+    child = flask.Blueprint("child", __name__)
+
+    def add_hooks(scaffold, name):
+        @scaffold.before_request
+        def before():
+            flask.g.setdefault("seen", []).append(f"before_{name}")
+
+        @scaffold.after_request
+        def after(response):
+            flask.g.seen.append(f"after_{name}")
+            return response
+
+        @scaffold.context_processor
+        def context():
+            return {name: True}
+
+    def run_hooks(path):
+        with app.test_request_context(path):
+            app.preprocess_request()
+            app.process_response(app.response_class())
+            context = {}
+            app.update_template_context(context)
+            return flask.g.seen, sorted(k for k in context if k.startswith("h_"))
+
+    add_hooks(app, "h_app1")
+    add_hooks(parent, "h_parent")
+    add_hooks(child, "h_child")
+    app.add_url_rule("/", "index", lambda: "")
+    child.add_url_rule("/", "index", lambda: "")
+    parent.register_blueprint(child, url_prefix="/child")
+    app.register_blueprint(parent, url_prefix="/parent")
+    assert run_hooks("/") == (
+        ["before_h_app1", "after_h_app1"],
+        ["h_app1"],
+    )
+    assert run_hooks("/parent/child/") == (
+        [
+            "before_h_app1",
+            "before_h_parent",
+            "before_h_child",
+            "after_h_child",
+            "after_h_parent",
+            "after_h_app1",
+        ],
+        ["h_app1", "h_child", "h_parent"],
+    )
+
+    other = flask.Blueprint("other", __name__)
+    other_child = flask.Blueprint("child", __name__)
+    add_hooks(app, "h_app2")
+    add_hooks(other, "h_other")
+    add_hooks(other_child, "h_other_child")
+    other_child.add_url_rule("/", "index", lambda: "")
+    other.register_blueprint(other_child, url_prefix="/child")
+    app.register_blueprint(other, url_prefix="/other")
+    assert run_hooks("/") == (
+        ["before_h_app1", "before_h_app2", "after_h_app2", "after_h_app1"],
+        ["h_app1", "h_app2"],
+    )
+    assert run_hooks("/parent/child/") == (
+        [
+            "before_h_app1",
+            "before_h_app2",
+            "before_h_parent",
+            "before_h_child",
+            "after_h_child",
+            "after_h_parent",
+            "after_h_app2",
+            "after_h_app1",
+        ],
+        ["h_app1", "h_app2", "h_child", "h_parent"],
+    )
+    assert run_hooks("/other/child/") == (
+        [
+            "before_h_app1",
+            "before_h_app2",
+            "before_h_other",
+            "before_h_other_child",
+            "after_h_other_child",
+            "after_h_other",
+            "after_h_app2",
+            "after_h_app1",
+        ],
+        ["h_app1", "h_app2", "h_other", "h_other_child"],
+    )
+
+
 def test_error_handling(app, client):
     app.testing = False
 
@@ -1659,6 +1766,36 @@ def test_inject_blueprint_url_defaults(app):
     assert url == expected
 
 
+def test_url_defaults_registered_after_build(app):
+    values = {}
+    app.inject_url_defaults("index", values)
+    assert values == {}
+
+    @app.url_defaults
+    def defaults(endpoint, values):
+        values["page"] = "login"
+
+    app.inject_url_defaults("index", values)
+    assert values == {"page": "login"}
+
+
+def test_url_defaults_unknown_blueprint_not_cached(app):
+    bp = flask.Blueprint("bp", __name__)
+
+    @app.url_defaults
+    def defaults(endpoint, values):
+        values["page"] = "login"
+
+    app.register_blueprint(bp)
+
+    for name in ("bp", "other", "bp.other"):
+        values = {}
+        app.inject_url_defaults(f"{name}.index", values)
+        assert values == {"page": "login"}
+
+    assert set(app._url_defaults_cache) == {"bp"}
+
+
 def test_nonascii_pathinfo(app, client):
     @app.route("/киртест")
     def index():
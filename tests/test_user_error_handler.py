@@ -58,6 +58,67 @@ def test_error_handler_no_match(app, client):
     assert client.get("/abort").data == b"direct"
 
 
+def test_error_handler_cached_per_blueprint(app, client):
+    class CustomException(Exception):
+        pass
+
+    bp = flask.Blueprint("bp", __name__)
+
+    @app.errorhandler(CustomException)
+    def app_exception_handler(e):
+        return "app"
+
+    @bp.errorhandler(CustomException)
+    def bp_exception_handler(e):
+        return "bp"
+
+    @app.route("/error")
+    def app_test():
+        raise CustomException()
+
+    @bp.route("/error")
+    def bp_test():
+        raise CustomException()
+
+    app.register_blueprint(bp, url_prefix="/bp")
+
+    for _ in range(2):
+        assert client.get("/error").data == b"app"
+        assert client.get("/bp/error").data == b"bp"
+
+
+def test_error_handler_many_exception_classes(app, client):
+    class ParentException(Exception):
+        pass
+
+    classes = [type(f"Child{i}", (ParentException,), {}) for i in range(300)]
+
+    @app.errorhandler(ParentException)
+    def parent_exception_handler(e):
+        return type(e).__name__
+
+    @app.route("/error/<int:index>")
+    def error_test(index):
+        raise classes[index]()
+
+    for i in (*range(300), 0):
+        assert client.get(f"/error/{i}").data == f"Child{i}".encode()
+
+
+def test_error_handler_lookup_does_not_modify_spec(app, client):
+    bp = flask.Blueprint("bp", __name__)
+
+    @bp.route("/missing")
+    def bp_missing():
+        flask.abort(404)
+
+    app.register_blueprint(bp, url_prefix="/bp")
+
+    assert client.get("/bp/missing").status_code == 404
+    assert "bp" not in app.error_handler_spec
+    assert 404 not in app.error_handler_spec.get(None, {})
+
+
 def test_error_handler_subclass(app):
     class ParentException(Exception):
         pass